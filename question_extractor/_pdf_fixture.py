@@ -0,0 +1,34 @@
+"""
+Shared PDF fixture for the PDF processor tests.
+
+The fixture bytes are rendered once per process and only written to disk
+when the file is missing or its contents differ.
+"""
+
+import io
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=None)
+def build_fixture_bytes(pages: int = 10) -> bytes:
+    """Render a simple PDF with "Page N" drawn on each page (requires reportlab)."""
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    # invariant=1 drops timestamps/random IDs so output is reproducible
+    c = canvas.Canvas(buffer, invariant=1)
+    for i in range(pages):
+        c.drawString(100, 750, f"Page {i+1}")
+        c.showPage()
+    c.save()
+    return buffer.getvalue()
+
+
+def write_fixture(path, pages: int = 10) -> Path:
+    """Write the fixture PDF to path unless an identical file is already there."""
+    path = Path(path)
+    data = build_fixture_bytes(pages)
+    if not path.exists() or path.read_bytes() != data:
+        path.write_bytes(data)
+    return path
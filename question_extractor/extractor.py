@@ -15,12 +15,17 @@ import os
 import re
 import argparse
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Union
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
 import glob
 import sys
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import local modules
 try:
     from pdf_processor import PDFProcessor, PDFPage
@@ -35,6 +40,21 @@ except ImportError:
 JSON_BLOCK_PATTERN = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
 
 
+def _loads_json(data):
+    """
+    Parse JSON text or bytes, using orjson when it is installed.
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+    """
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _dump_json(data) -> bytes:
+    """Serialize data as UTF-8 JSON with 2-space indentation."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
 @dataclass
 class ExtractedQuestion:
     """Represents an extracted question from a paper."""
@@ -55,6 +75,7 @@ class ExtractedQuestion:
 # ... imports ...
 from question_extractor.topic_manager import TopicManager
 from question_extractor.prompt_generator import PromptGenerator
+from question_extractor.file_utils import write_atomic
 
 # ... (ExtractedQuestion dataclass remains) ...
 
@@ -170,13 +191,11 @@ class QuestionExtractor:
             self.extracted_questions.append(question)
             
             # Update index
-            if question.source_paper not in self.questions_by_paper:
-                self.questions_by_paper[question.source_paper] = []
-            self.questions_by_paper[question.source_paper].append(question)
+            self.questions_by_paper.setdefault(question.source_paper, []).append(question)
     
     def add_questions_from_json(
         self, 
-        json_data: str, 
+        json_data: Union[str, bytes], 
         source_paper: str = "",
         page_number: int = 0
     ):
@@ -184,26 +203,48 @@ class QuestionExtractor:
         Parse JSON output from AI extraction and add questions.
         
         Args:
-            json_data: JSON string with extracted questions
+            json_data: JSON string with extracted questions (UTF-8 bytes, e.g. a
+                file read with read_bytes(), are parsed without decoding first)
             source_paper: Name of the source paper
             page_number: Page number for tracking
         """
         try:
-            data = json.loads(json_data)
+            data = _loads_json(json_data)
         except json.JSONDecodeError:
             # Try to extract JSON from markdown code block
+            if isinstance(json_data, bytes):
+                json_data = json_data.decode('utf-8')
             json_match = JSON_BLOCK_PATTERN.search(json_data)
             if json_match:
-                data = json.loads(json_match.group(1))
+                data = _loads_json(json_match.group(1))
             else:
                 raise ValueError("Could not parse JSON from response")
         
+        return self._add_questions(data, source_paper, page_number)
+
+    def _add_questions(self, data: Dict[str, Any], source_paper: str = "", page_number: int = 0) -> int:
+        """
+        Add questions from an already-parsed extraction payload.
+        
+        Args:
+            data: Payload with a "page_questions" or "questions" list
+            source_paper: Name of the source paper
+            page_number: Page number for tracking
+            
+        Returns:
+            Number of questions in the payload (duplicates included)
+        """
         # Support both "questions" and "page_questions" keys
         questions = data.get("page_questions", data.get("questions", []))
         
         for q in questions:
+            question_number = q.get("question_number", "")
+            paper = q.get("source_paper", source_paper)
+            # Re-sent questions are skipped before building a dataclass for them
+            if (question_number, paper) in self._existing_signatures:
+                continue
             question = ExtractedQuestion(
-                question_number=q.get("question_number", ""),
+                question_number=question_number,
                 question_text=q.get("question_text", ""),
                 topic=q.get("topic", "Unknown"),
                 unit=q.get("unit", ""),
@@ -212,15 +253,14 @@ class QuestionExtractor:
                 has_diagram=q.get("has_diagram", False),
                 difficulty=q.get("difficulty"),
                 page_number=page_number if page_number else q.get("page_number", 0),
-                source_paper=q.get("source_paper", source_paper)
+                source_paper=paper
             )
             self.add_question(question)
         
         # Track processed pages
-        if source_paper not in self.processed_pages:
-            self.processed_pages[source_paper] = []
-        if page_number and page_number not in self.processed_pages[source_paper]:
-            self.processed_pages[source_paper].append(page_number)
+        processed = self.processed_pages.setdefault(source_paper, [])
+        if page_number and page_number not in processed:
+            processed.append(page_number)
         
         return len(questions)
     
@@ -236,16 +276,18 @@ class QuestionExtractor:
             Progress dictionary
         """
         processed = self.processed_pages.get(source_paper, [])
-        questions = self.questions_by_paper.get(source_paper, [])
+        pages_processed = len(processed)
+        # Per-paper index keeps this an O(1) lookup instead of a scan
+        questions_extracted = len(self.questions_by_paper.get(source_paper, ()))
         
         return {
             "source_paper": source_paper,
             "total_pages": total_pages,
-            "pages_processed": len(processed),
-            "pages_remaining": total_pages - len(processed),
-            "questions_extracted": len(questions),
+            "pages_processed": pages_processed,
+            "pages_remaining": total_pages - pages_processed,
+            "questions_extracted": questions_extracted,
             "processed_page_numbers": sorted(processed),
-            "completion_percentage": round(len(processed) / total_pages * 100, 1) if total_pages > 0 else 0
+            "completion_percentage": round(pages_processed / total_pages * 100, 1) if total_pages > 0 else 0
         }
     
     def get_questions_by_topic(self, topic: str) -> List[ExtractedQuestion]:
@@ -344,8 +386,7 @@ class QuestionExtractor:
             "processed_pages": self.processed_pages,
             "questions": [asdict(q) for q in self.extracted_questions]
         }
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        Path(output_path).write_bytes(_dump_json(data))
 
     def _save_as_txt(self, output_path: Path):
         """Helper to save as TXT."""
@@ -547,8 +588,7 @@ def _handle_batch_manifest(args, extractor) -> int:
     
     # Save manifest
     manifest_path = Path(args.batch_manifest) / "extraction_manifest.json"
-    with open(manifest_path, 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, indent=2)
+    manifest_path.write_bytes(_dump_json(manifest))
 
     if not args.quiet:
         print(f"✓ Manifest saved to {manifest_path}")
@@ -577,6 +617,25 @@ def _handle_pdf_processing(args, extractor) -> int:
         return 1
     return 0
 
+def _find_summary_insert_position(content: str) -> int:
+    """
+    Find where appended questions go: before the first SUMMARY /
+    CUMULATIVE SUMMARY line (and its '=' separator), or at EOF.
+    """
+    summary_markers = ("SUMMARY", "CUMULATIVE SUMMARY")
+    prev_start = None
+    pos = 0
+    for line in content.splitlines(keepends=True):
+        if line.strip() in summary_markers:
+            if prev_start is not None:
+                prev = content[prev_start:pos].strip()
+                if len(prev) > 3 and set(prev) == {'='}:
+                    return prev_start
+            return pos
+        prev_start = pos
+        pos += len(line)
+    return len(content)
+
 def _handle_append_results(args, extractor) -> int:
     if not os.path.exists(args.append_results):
         print(f"Error: Source file {args.append_results} not found.")
@@ -588,7 +647,7 @@ def _handle_append_results(args, extractor) -> int:
 
     # Try to parse as JSON first (from agent output)
     try:
-        data = json.loads(source_content)
+        data = _loads_json(source_content)
         # Handle if the input is a list of questions directly
         if isinstance(data, list):
             questions_list = data
@@ -639,92 +698,22 @@ def _handle_append_results(args, extractor) -> int:
             with open(target_path, 'w', encoding='utf-8') as f:
                 f.write(text_to_append)
     else:
-        # Append before summary using streaming to avoid reading full file
-        import tempfile
-        import shutil
-
-        summary_markers = ["SUMMARY", "CUMULATIVE SUMMARY"]
-        inserted = False
-
         # Resolve symlinks to ensure we modify the actual file
         target_path = os.path.realpath(target_path)
 
-        # Create temp file
-        target_dir = os.path.dirname(target_path)
-        # Use mkstemp to create a unique temp file in the same directory (for atomic move)
-        fd, temp_path = tempfile.mkstemp(dir=target_dir, text=True)
+        with open(target_path, 'r', encoding='utf-8') as f:
+            content = f.read()
 
-        # Copy permissions from target file to temp file
-        try:
-            shutil.copymode(target_path, temp_path)
-        except OSError:
-            pass  # Ignore if permissions cannot be copied
+        # Build the full new content in memory and write it in one go
+        insert_at = _find_summary_insert_position(content)
+        block = text_to_append
+        if not block.startswith('\n'):
+            block = '\n' + block
+        if not block.endswith('\n'):
+            block += '\n'
+        new_content = content[:insert_at] + block + content[insert_at:]
 
-        try:
-            with os.fdopen(fd, 'w', encoding='utf-8') as temp_file:
-                with open(target_path, 'r', encoding='utf-8') as source_file:
-                    buffer_lines = []
-
-                    for line in source_file:
-                        if inserted:
-                            temp_file.write(line)
-                            continue
-
-                        stripped = line.strip()
-                        is_summary = stripped in summary_markers
-
-                        if is_summary:
-                            # Check for separator line in buffer
-                            separator = None
-                            if buffer_lines and set(buffer_lines[-1].strip()) == {'='} and len(buffer_lines[-1].strip()) > 3:
-                                separator = buffer_lines.pop()
-
-                            # Flush remaining buffer
-                            for buf_line in buffer_lines:
-                                temp_file.write(buf_line)
-                            buffer_lines = []
-
-                            # Insert new content
-                            # Ensure surrounding newlines for clean formatting
-                            if not text_to_append.startswith('\n'):
-                                temp_file.write('\n')
-                            temp_file.write(text_to_append)
-                            if not text_to_append.endswith('\n'):
-                                temp_file.write('\n')
-
-                            # Write separator if it existed
-                            if separator:
-                                temp_file.write(separator)
-
-                            # Write summary line
-                            temp_file.write(line)
-                            inserted = True
-                        else:
-                            buffer_lines.append(line)
-                            # Keep a small buffer context
-                            if len(buffer_lines) > 2:
-                                temp_file.write(buffer_lines.pop(0))
-
-                    # Flush remaining buffer at EOF
-                    for buf_line in buffer_lines:
-                        temp_file.write(buf_line)
-
-                    if not inserted:
-                        # Append at end if no summary found
-                        if not text_to_append.startswith('\n'):
-                            temp_file.write('\n')
-                        temp_file.write(text_to_append)
-                        if not text_to_append.endswith('\n'):
-                            temp_file.write('\n')
-
-            # Replace original file atomically
-            shutil.move(temp_path, target_path)
-
-        except Exception as e:
-            # Clean up temp file on error
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-            raise e
+        write_atomic(target_path, new_content)
 
     # Update summary counts
     if update_summary:
@@ -737,8 +726,12 @@ def _handle_append_results(args, extractor) -> int:
 
     return 0
 
-def main():
-    """Command line interface for the question extractor."""
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line interface for the question extractor.
+
+    Args:
+        argv: Argument list to parse (defaults to sys.argv[1:])
+    """
     parser = argparse.ArgumentParser(
         description="ICSE Class 10 Math Question Extractor Framework",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -771,7 +764,7 @@ Examples:
     parser.add_argument("--target", type=str, help="Target question bank file to append to")
     parser.add_argument("--quiet", action="store_true", help="Suppress verbose output (useful for agent execution)")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Initialize extractor
     try:
@@ -17,23 +17,34 @@ Usage:
 """
 
 from __future__ import annotations
+import importlib.util
 import math
+import os
 import re
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Tuple, Any, Callable
+from typing import Optional, List, Dict, Tuple, Any, Callable, BinaryIO, Union
 from pathlib import Path
 
-try:
+# matplotlib takes a few hundred ms to import, so it is only probed here and
+# imported by the first FigureRenderer (see _import_matplotlib)
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+if not MATPLOTLIB_AVAILABLE:
+    print("Warning: matplotlib not installed. Figure rendering will be disabled.")
+
+plt = Arc = MplCircle = Ellipse = None
+
+
+def _import_matplotlib():
+    """Import matplotlib on the Agg backend and bind the names the renderer draws with."""
+    global plt, Arc, MplCircle, Ellipse
+    if plt is not None:
+        return
     import matplotlib
     matplotlib.use('Agg')
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as patches
-    from matplotlib.patches import Arc, Circle as MplCircle, FancyArrowPatch, Ellipse
-    from matplotlib.lines import Line2D
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    print("Warning: matplotlib not installed. Figure rendering will be disabled.")
+    import matplotlib.pyplot as pyplot
+    from matplotlib.patches import Arc as _Arc, Circle as _MplCircle, Ellipse as _Ellipse
+    Arc, MplCircle, Ellipse = _Arc, _MplCircle, _Ellipse
+    plt = pyplot
 
 # Import our schema
 try:
@@ -60,6 +71,8 @@ class RenderConfig:
     figsize: Tuple[float, float] = (8, 8)
     dpi: int = 150
     background_color: str = 'white'
+    # zlib level for PNG output (0-9); lower saves faster, larger files
+    png_compress_level: int = 6
     
     # Default geometry settings
     default_radius: float = 3.0
@@ -127,8 +140,9 @@ class PointLayoutEngine:
                     description_tasks.append((point.label, deps, solver))
 
         # Iteratively solve for dependencies (max 10 passes)
-        # Use a list of active tasks to avoid re-checking solved ones
-        active_tasks = list(description_tasks)
+        # Use a list of active tasks to avoid re-checking solved ones, ordered so
+        # a chain of described points (C from AB, D from AC, ...) resolves in one pass
+        active_tasks = self._order_description_tasks(description_tasks)
 
         for _ in range(10):
             previous_positions = self.positions.copy()
@@ -185,6 +199,39 @@ class PointLayoutEngine:
         
         return self.positions
     
+    @staticmethod
+    def _order_description_tasks(
+        tasks: List[Tuple[str, List[str], Callable]]
+    ) -> List[Tuple[str, List[str], Callable]]:
+        """
+        Topologically sort description tasks so each follows the described points it uses.
+        Sorted by index (Kahn's algorithm), so repeated labels keep all their tasks.
+        """
+        indices_by_label: Dict[str, List[int]] = {}
+        for i, (label, _, _) in enumerate(tasks):
+            indices_by_label.setdefault(label, []).append(i)
+        
+        dependents: List[List[int]] = [[] for _ in tasks]
+        pending = [0] * len(tasks)
+        for i, (_, deps, _) in enumerate(tasks):
+            for dep in dict.fromkeys(deps):
+                for j in indices_by_label.get(dep, ()):
+                    dependents[j].append(i)
+                    pending[i] += 1
+        
+        # The ready list grows while it is walked; input order breaks ties
+        ready = [i for i, count in enumerate(pending) if count == 0]
+        for i in ready:
+            for k in dependents[i]:
+                pending[k] -= 1
+                if pending[k] == 0:
+                    ready.append(k)
+        
+        if len(ready) < len(tasks):
+            # Circular descriptions can't be ordered; let the passes sort them out
+            return list(tasks)
+        return [tasks[i] for i in ready]
+    
     def _position_points_on_circle(self, circle: Circle, figure: GeometryFigure):
         """Position points that lie on a circle."""
         
@@ -439,6 +486,7 @@ class FigureRenderer:
     def __init__(self, config: Optional[RenderConfig] = None):
         if not MATPLOTLIB_AVAILABLE:
             raise ImportError("matplotlib is required for figure rendering. Install with: pip install matplotlib")
+        _import_matplotlib()
         
         self.config = config or RenderConfig()
         self.layout_engine = PointLayoutEngine(self.config)
@@ -467,8 +515,13 @@ class FigureRenderer:
         self.dynamic_arc_radius = self.scale * 0.08
         self.dynamic_label_offset = self.scale * 0.04
 
-        # Create figure and axes
-        self.fig, self.ax = plt.subplots(1, 1, figsize=self.config.figsize)
+        # Create figure and axes; a figure left by an earlier render is cleared
+        # and reused rather than building a new canvas
+        if self.fig is None:
+            self.fig, self.ax = plt.subplots(1, 1, figsize=self.config.figsize)
+        else:
+            self.fig.clf()
+            self.ax = self.fig.add_subplot(1, 1, 1)
         self.ax.set_aspect('equal')
         self.ax.set_facecolor(self.config.background_color)
         
@@ -839,8 +892,8 @@ class FigureRenderer:
         self.ax.set_xlim(x_center - max_range/2 - margin, x_center + max_range/2 + margin)
         self.ax.set_ylim(y_center - max_range/2 - margin, y_center + max_range/2 + margin)
     
-    def save_png(self, output_path: str, dpi: Optional[int] = None):
-        """Save the rendered figure as PNG."""
+    def save_png(self, output_path: Union[str, os.PathLike, BinaryIO], dpi: Optional[int] = None):
+        """Save the rendered figure as PNG to a path or a binary file object."""
         if self.fig is None:
             raise ValueError("No figure rendered. Call render() first.")
         
@@ -849,12 +902,14 @@ class FigureRenderer:
             dpi=dpi or self.config.dpi,
             bbox_inches='tight',
             facecolor=self.config.background_color,
-            edgecolor='none'
+            edgecolor='none',
+            pil_kwargs={"compress_level": self.config.png_compress_level}
         )
-        print(f"Saved PNG: {output_path}")
+        if isinstance(output_path, (str, os.PathLike)):
+            print(f"Saved PNG: {output_path}")
     
-    def save_svg(self, output_path: str):
-        """Save the rendered figure as SVG."""
+    def save_svg(self, output_path: Union[str, os.PathLike, BinaryIO]):
+        """Save the rendered figure as SVG to a path or a binary file object."""
         if self.fig is None:
             raise ValueError("No figure rendered. Call render() first.")
         
@@ -865,7 +920,8 @@ class FigureRenderer:
             facecolor=self.config.background_color,
             edgecolor='none'
         )
-        print(f"Saved SVG: {output_path}")
+        if isinstance(output_path, (str, os.PathLike)):
+            print(f"Saved SVG: {output_path}")
     
     def show(self):
         """Display the figure interactively."""
@@ -873,6 +929,12 @@ class FigureRenderer:
             raise ValueError("No figure rendered. Call render() first.")
         plt.show()
     
+    def clear(self):
+        """Clear the drawing but keep the figure for the next render()."""
+        if self.fig is not None:
+            self.fig.clf()
+            self.ax = None
+    
     def close(self):
         """Close the figure and free memory."""
         if self.fig is not None:
@@ -0,0 +1,33 @@
+"""
+File Utilities Module
+Shared helpers for rewriting question bank files safely.
+"""
+
+import os
+import shutil
+import tempfile
+
+
+def write_atomic(target_path: str, content: str):
+    """Write content to a temp file next to target_path, then replace it atomically."""
+    # Resolve symlinks so the real file is replaced, not the link
+    target_path = os.path.realpath(target_path)
+
+    # Use mkstemp to create a unique temp file in the same directory (for atomic move)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(target_path), text=True)
+
+    # Copy permissions from target file to temp file
+    try:
+        shutil.copymode(target_path, temp_path)
+    except OSError:
+        pass  # Ignore if permissions cannot be copied
+
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as temp_file:
+            temp_file.write(content)
+        os.replace(temp_path, target_path)
+    except Exception:
+        # Clean up temp file on error
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
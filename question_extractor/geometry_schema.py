@@ -12,6 +12,8 @@ Usage:
     print(figure.to_dict())
 """
 
+import copy
+import functools
 import re
 import yaml
 import textwrap
@@ -19,6 +21,21 @@ from dataclasses import dataclass, field, asdict
 from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 
+try:
+    # libyaml-backed loader; same safe semantics, parsed in C
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_yaml_block(text: str) -> Any:
+    """
+    Load a normalized figure block. The same figures recur across question
+    banks, so results are cached; the value is shared, callers copy before use.
+    """
+    return yaml.load(text, Loader=_YamlLoader)
+
 
 class FigureType(Enum):
     """Supported geometry figure types for ICSE Class 10."""
@@ -192,7 +209,7 @@ class GeometryFigure:
             labels.add(tangent.point_of_tangency)
             if tangent.external_point:
                 labels.add(tangent.external_point)
-        return sorted(list(labels))
+        return sorted(labels)
 
 
 class FigureParser:
@@ -203,8 +220,21 @@ class FigureParser:
         re.DOTALL | re.IGNORECASE
     )
     
-    def __init__(self):
-        self.figure_type_map = {ft.value: ft for ft in FigureType}
+    # A top-level "key: value" line whose value YAML would load as a plain string
+    FLAT_LINE_PATTERN = re.compile(r'([A-Za-z_][A-Za-z0-9_]*): +([A-Za-z][^:#\'"\t\r]*?) *')
+    # Plain words YAML resolves to booleans or null instead of strings
+    YAML_NON_STRING_WORDS = frozenset(
+        word for base in ('yes', 'no', 'true', 'false', 'on', 'off', 'null')
+        for word in (base, base.capitalize(), base.upper())
+    )
+    
+    # FigureType lookup by value; built once for the class, shared by every parser
+    figure_type_map = {ft.value: ft for ft in FigureType}
+    
+    @staticmethod
+    def cache_clear():
+        """Drop the cached YAML loads of previously parsed figure blocks."""
+        _load_yaml_block.cache_clear()
     
     def extract_figure_blocks(self, text: str) -> List[str]:
         """Extract all [FIGURE] blocks from text."""
@@ -222,38 +252,40 @@ class FigureParser:
         lines = block.split('\n')
         
         # Find first non-empty line
-        first_idx = -1
-        for i, line in enumerate(lines):
-            if line.strip():
-                first_idx = i
-                break
-        
+        first_idx = next((i for i, line in enumerate(lines) if line.strip()), -1)
         if first_idx == -1:
             return block.strip()
-            
-        first_line = lines[first_idx]
-        first_indent = len(first_line) - len(first_line.lstrip())
         
-        # Find minimum indent of subsequent non-empty lines
-        min_subsequent = float('inf')
-        has_subsequent = False
+        first_line = lines[first_idx]
+        rest = lines[first_idx + 1:]
+        if first_line[:1].isspace() or not rest:
+            # Indentation is consistent: standard dedent removes common leading whitespace
+            return textwrap.dedent(block)
         
-        for i in range(first_idx + 1, len(lines)):
-            line = lines[i]
-            if line.strip():
-                indent = len(line) - len(line.lstrip())
-                if indent < min_subsequent:
-                    min_subsequent = indent
-                has_subsequent = True
+        # First line has lost its indent: treat the subsequent lines' indentation
+        # as the baseline and dedent them on their own
+        return "\n" * first_idx + first_line + "\n" + textwrap.dedent("\n".join(rest))
+    
+    def _parse_flat_block(self, block: str) -> Optional[Dict[str, str]]:
+        """
+        Read a block made only of unindented "key: value" lines without YAML.
         
-        # If first line has lost its indent (0) but subsequent lines preserve it (>0),
-        # we treat subsequent indentation as the baseline.
-        if has_subsequent and first_indent == 0 and min_subsequent > 0:
-            # Reconstruct first line with matching indentation
-            lines[first_idx] = (" " * min_subsequent) + first_line
-            
-        # Use standard dedent to remove common leading whitespace
-        return textwrap.dedent("\n".join(lines))
+        Returns the same dict yaml would, or None when any line needs the real
+        parser (nesting, lists, quotes, comments, non-string scalars).
+        """
+        data = {}
+        for line in block.split('\n'):
+            if not line.strip(' '):
+                continue
+            match = self.FLAT_LINE_PATTERN.fullmatch(line)
+            if match is None:
+                return None
+            key, value = match.groups()
+            if (key in self.YAML_NON_STRING_WORDS or value in self.YAML_NON_STRING_WORDS
+                    or not value.isprintable()):
+                return None
+            data[key] = value
+        return data or None
     
     def parse(self, figure_block: str) -> GeometryFigure:
         """
@@ -264,11 +296,17 @@ class FigureParser:
         # Normalize indentation - figure blocks from question banks may be indented
         normalized_block = self._normalize_yaml_block(figure_block)
         
+        # Flat "key: value" blocks are the common case and need no YAML parser
+        data = self._parse_flat_block(normalized_block)
+        if data is not None:
+            return self._parse_yaml_format(data)
+        
         # Try YAML parsing first
         try:
-            data = yaml.safe_load(normalized_block)
+            data = _load_yaml_block(normalized_block)
             if isinstance(data, dict):
-                return self._parse_yaml_format(data)
+                # The figure keeps (and updates) the dict, so never hand out the cached one
+                return self._parse_yaml_format(copy.deepcopy(data))
         except yaml.YAMLError:
             pass
         
@@ -440,9 +478,10 @@ class FigureParser:
         
         Returns None if no figure block found.
         """
-        blocks = self.extract_figure_blocks(question_text)
-        if blocks:
-            return self.parse(blocks[0])
+        # Only the first block is parsed, so stop scanning at it
+        match = self.FIGURE_BLOCK_PATTERN.search(question_text)
+        if match:
+            return self.parse(match.group(1).strip())
         return None
 
 
@@ -471,7 +510,8 @@ class FigureValidator:
                 defined_labels.add(p.label)
         
         # 3. Check for referenced points (structural elements)
-        structural_labels = set(p.label for p in figure.points)
+        # Angles are left out on purpose: they must reference these labels.
+        structural_labels = set(defined_labels)
         for line in figure.lines:
             structural_labels.add(line.start)
             structural_labels.add(line.end)
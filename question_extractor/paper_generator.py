@@ -22,6 +22,7 @@ import argparse
 import os
 import re
 import io
+import sys
 import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -65,7 +66,12 @@ except ImportError:
 # Data Models
 # ============================================================================
 
-@dataclass
+# Banks hold thousands of questions: drop the per-instance __dict__ where
+# dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Question:
     """Represents a parsed question from the question bank."""
     
@@ -81,7 +87,7 @@ class Question:
     sub_parts: List[Dict] = field(default_factory=list)  # Sub-parts for multi-part questions
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Section:
     """Represents a section in the exam paper."""
     
@@ -143,9 +149,12 @@ class QuestionBankParser:
         re.DOTALL | re.IGNORECASE
     )
 
+    # Pattern to split content on Topic headers (optionally preceded by a separator)
+    SECTION_SPLIT_PATTERN = re.compile(r'(?:^|\n)(?:-{10,}\s*\n)?Topic:\s*(.+?)\s*\n')
+
     def _split_sections(self, content: str) -> List[str]:
         """Split content into sections based on Topic headers."""
-        return re.split(r'(?:^|\n)(?:-{10,}\s*\n)?Topic:\s*(.+?)\s*\n', content)
+        return self.SECTION_SPLIT_PATTERN.split(content)
     
     # Pattern to match source
     SOURCE_PATTERN = re.compile(r'\[Source:\s*(.+?)\]', re.IGNORECASE)
@@ -155,6 +164,9 @@ class QuestionBankParser:
     
     # Pattern to match separator lines
     SEPARATOR_PATTERN = re.compile(r'-{10,}')
+    
+    # Pattern to match the separator that closes a section's last question
+    SECTION_END_PATTERN = re.compile(r'-{20,}')
 
     def __init__(self):
         self.questions: List[Question] = []
@@ -203,8 +215,8 @@ class QuestionBankParser:
                 end = matches[i + 1].start()
             else:
                 # Find the separator
-                sep_match = re.search(r'-{20,}', section[start:])
-                end = start + sep_match.start() if sep_match else len(section)
+                sep_match = self.SECTION_END_PATTERN.search(section, start)
+                end = sep_match.start() if sep_match else len(section)
             
             question_content = section[start:end].strip()
             
@@ -777,34 +789,42 @@ class PaperBuilder:
         
         sections = []
         
+        # One pass buckets questions in bank order: MCQs (1 mark each) for
+        # Section A, short (3-6 marks) and long (8+ marks) answers for Section B.
+        # Stops as soon as every bucket is full.
+        mcqs, short_answer, long_answer = [], [], []
+        for q in available:
+            if q.is_mcq or q.marks == 1:
+                if len(mcqs) < 10:
+                    mcqs.append(q)
+            elif 3 <= q.marks <= 6:
+                if len(short_answer) < 5:
+                    short_answer.append(q)
+            elif q.marks >= 8:
+                if len(long_answer) < 4:
+                    long_answer.append(q)
+            else:
+                continue
+            if len(mcqs) == 10 and len(short_answer) == 5 and len(long_answer) == 4:
+                break
+        
         # Section A: MCQs (1 mark each)
-        mcqs = [q for q in available if q.is_mcq or q.marks == 1]
         section_a = Section(
             name="Section A",
             description="Attempt all questions. (Multiple Choice Questions)",
             total_marks=10
         )
-        section_a.questions = mcqs[:10] if len(mcqs) >= 10 else mcqs
+        section_a.questions = mcqs
         sections.append(section_a)
         
         # Section B: Short/Long answer
-        non_mcqs = [q for q in available if not q.is_mcq and q.marks > 1]
-        
-        # Split by marks
-        short_answer = [q for q in non_mcqs if 3 <= q.marks <= 6]
-        long_answer = [q for q in non_mcqs if q.marks >= 8]
-        
         section_b = Section(
             name="Section B",
             description="Attempt any four questions from this Section.",
             total_marks=total_marks - 10
         )
-        
-        # Add short answer questions
-        section_b.questions.extend(short_answer[:5])
-        
-        # Add long answer questions
-        section_b.questions.extend(long_answer[:4])
+        section_b.questions.extend(short_answer)
+        section_b.questions.extend(long_answer)
         
         sections.append(section_b)
         
@@ -4,21 +4,50 @@ Handles PDF to image conversion for visual analysis.
 """
 
 import os
+import sys
+import functools
+import base64
 from pathlib import Path
 from typing import List, Optional, Tuple, Any
-import base64
 from dataclasses import dataclass
 import concurrent.futures
 
+# Cache key placeholder for a backend module that has not been imported yet
+_NOT_IMPORTED = object()
+
 @dataclass
 class PDFPage:
-    """Represents a converted PDF page."""
+    """
+    Represents a converted PDF page.
+    width/height are None for pages pdf2image wrote straight to disk;
+    read them through `size`, which fills them in from the saved image.
+    """
     page_number: int
-    width: int
-    height: int
+    width: Optional[int] = None
+    height: Optional[int] = None
     image_path: Optional[str] = None
     image_bytes: Optional[bytes] = None
 
+    @functools.cached_property
+    def image_base64(self) -> Optional[str]:
+        """Base64 of image_bytes, encoded on first access only."""
+        if self.image_bytes is None:
+            return None
+        return base64.b64encode(self.image_bytes).decode('ascii')
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        """
+        Get (width, height), reading it from the saved image if not recorded.
+        Pages written straight to disk by pdf2image skip decoding, so their
+        dimensions are only looked up here (header read, no pixel load).
+        """
+        if (self.width is None or self.height is None) and self.image_path:
+            from PIL import Image
+            with Image.open(self.image_path) as img:
+                self.width, self.height = img.size
+        return self.width, self.height
+
 class ProcessWorker:
     """
     Worker class for processing PDF pages safely in parallel.
@@ -54,10 +83,19 @@ class ProcessWorker:
             cls._doc = None
             cls._pdf_path = None
 
-def _process_page_task(args: Tuple[str, int, int, str, Optional[Path]]) -> Optional[PDFPage]:
+def _init_worker():
+    """Initialize a pool worker: silence MuPDF's diagnostic output."""
+    import fitz
+    fitz.TOOLS.mupdf_display_errors(False)
+
+def _process_page_task(
+    args: Tuple[str, int, int, str, Optional[Path]]
+) -> Tuple[Optional[PDFPage], Optional[str]]:
     """
     Helper function to process a single page in a separate process.
     Uses ProcessWorker to manage state.
+    Returns (page, error); errors are reported by the parent so workers
+    don't interleave output on the shared stdout.
     """
     pdf_path, page_num, dpi, output_format, output_dir = args
     import fitz
@@ -66,7 +104,7 @@ def _process_page_task(args: Tuple[str, int, int, str, Optional[Path]]) -> Optio
         doc = ProcessWorker.get_document(pdf_path)
         
         if page_num < 1 or page_num > len(doc):
-            return None
+            return None, None
 
         page = doc[page_num - 1]  # 0-indexed
 
@@ -87,13 +125,11 @@ def _process_page_task(args: Tuple[str, int, int, str, Optional[Path]]) -> Optio
             pix.save(str(image_path))
             pdf_page.image_path = str(image_path)
         else:
-            # Return as raw bytes (delay base64 encoding)
             pdf_page.image_bytes = pix.tobytes(output_format)
 
-        return pdf_page
+        return pdf_page, None
     except Exception as e:
-        print(f"Error processing page {page_num}: {e}")
-        return None
+        return None, f"Error processing page {page_num}: {e}"
 
 
 class PDFProcessor:
@@ -105,20 +141,34 @@ class PDFProcessor:
     - PyMuPDF (fitz)
     """
     
-    def __init__(self, dpi: int = 200, output_format: str = "png"):
+    def __init__(self, dpi: int = 200, output_format: str = "png", max_workers: Optional[int] = None):
         """
         Initialize the PDF processor.
         
         Args:
             dpi: Resolution for image conversion (default 200)
             output_format: Output image format (png, jpg)
+            max_workers: Number of parallel page renderers (default: os.cpu_count())
         """
         self.dpi = dpi
         self.output_format = output_format
+        self.max_workers = max_workers or os.cpu_count() or 1
         self._backend = self._detect_backend()
     
     def _detect_backend(self) -> str:
-        """Detect available PDF processing backend."""
+        """Detect available PDF processing backend (memoized per sys.modules state)."""
+        return self._detect_backend_cached(
+            sys.modules.get("fitz", _NOT_IMPORTED),
+            sys.modules.get("pdf2image", _NOT_IMPORTED)
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _detect_backend_cached(fitz_module, pdf2image_module) -> str:
+        """
+        Probe backend imports. The arguments are only the cache key: they change
+        when either module gets imported or is masked out of sys.modules.
+        """
         try:
             import fitz  # PyMuPDF
             return "pymupdf"
@@ -169,7 +219,7 @@ Option 2: pdf2image (Requires Poppler)
         
         Args:
             pdf_path: Path to the PDF file
-            output_dir: Directory to save images (optional, if None returns base64)
+            output_dir: Directory to save images (optional, if None returns image data in memory)
             pages: Specific page numbers to convert (1-indexed), None for all
             page_count: Total number of pages (optional optimization to avoid opening file)
             
@@ -237,12 +287,19 @@ Option 2: pdf2image (Requires Poppler)
             
         result = []
         # Use ProcessPoolExecutor for parallel processing
-        # Initialize each worker with the PDF file to avoid repeated opens
-        with concurrent.futures.ProcessPoolExecutor() as executor:
+        # Each worker process opens its own document (fitz docs are not fork-safe)
+        workers = min(self.max_workers, len(tasks)) or 1
+        # Hand out pages in chunks so each worker gets a few at a time
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker
+        ) as executor:
             # Map returns results in order
-            results = executor.map(_process_page_task, tasks)
+            results = executor.map(_process_page_task, tasks, chunksize=chunksize)
             
-            for res in results:
+            for res, error in results:
+                if error:
+                    print(error)
                 if res:
                     result.append(res)
 
@@ -256,7 +313,6 @@ Option 2: pdf2image (Requires Poppler)
     ) -> List[PDFPage]:
         """Convert using pdf2image with memory optimization."""
         from pdf2image import convert_from_path, pdfinfo_from_path
-        import io
         
         chunk_size = 50  # Process pages in chunks to reduce memory usage
         result = []
@@ -281,6 +337,10 @@ Option 2: pdf2image (Requires Poppler)
                 # but we need to know the range.
                 # Without page count, we can't loop effectively without risk.
                 # So we just do what we did before: load all.
+                if output_dir:
+                    paths = convert_from_path(str(pdf_path), **self._pdf2image_disk_kwargs(output_dir, 1))
+                    return self._collect_written_pages(paths, 1, output_dir)
+
                 kwargs = {"dpi": self.dpi}
                 images = convert_from_path(str(pdf_path), **kwargs)
                 for i, img in enumerate(images):
@@ -290,14 +350,7 @@ Option 2: pdf2image (Requires Poppler)
                         width=img.width,
                         height=img.height
                     )
-                    if output_dir:
-                        image_path = output_dir / f"page_{page_num:03d}.{self.output_format}"
-                        img.save(str(image_path), self.output_format.upper())
-                        pdf_page.image_path = str(image_path)
-                    else:
-                        buffer = io.BytesIO()
-                        img.save(buffer, format=self.output_format.upper())
-                        pdf_page.image_bytes = buffer.getvalue()
+                    pdf_page.image_bytes = self._encode_image(img)
                     result.append(pdf_page)
                 return result
 
@@ -311,6 +364,23 @@ Option 2: pdf2image (Requires Poppler)
                 if not chunk_pages.intersection(pages_set):
                     continue
             
+            if output_dir:
+                # Let pdftoppm write the files from its own worker threads;
+                # the main thread only collects the resulting paths.
+                try:
+                    paths = convert_from_path(
+                        str(pdf_path),
+                        first_page=chunk_start,
+                        last_page=chunk_end,
+                        **self._pdf2image_disk_kwargs(output_dir, chunk_start)
+                    )
+                except Exception:
+                    # Stop if we hit an error
+                    break
+
+                result.extend(self._collect_written_pages(paths, chunk_start, output_dir, pages_set))
+                continue
+
             try:
                 images = convert_from_path(
                     str(pdf_path),
@@ -335,15 +405,8 @@ Option 2: pdf2image (Requires Poppler)
                     height=img.height
                 )
 
-                if output_dir:
-                    image_path = output_dir / f"page_{page_num:03d}.{self.output_format}"
-                    img.save(str(image_path), self.output_format.upper())
-                    pdf_page.image_path = str(image_path)
-                else:
-                    # Return as raw bytes
-                    buffer = io.BytesIO()
-                    img.save(buffer, format=self.output_format.upper())
-                    pdf_page.image_bytes = buffer.getvalue()
+                # Return as raw bytes
+                pdf_page.image_bytes = self._encode_image(img)
 
                 result.append(pdf_page)
 
@@ -351,6 +414,50 @@ Option 2: pdf2image (Requires Poppler)
             del images
         
         return result
+
+    def _encode_image(self, img) -> bytes:
+        """Encode a PIL image in the output format and return its bytes."""
+        import io
+        buffer = io.BytesIO()
+        img.save(buffer, format=self.output_format.upper())
+        return buffer.getvalue()
+
+    def _pdf2image_disk_kwargs(self, output_dir: Path, first_page: int) -> dict:
+        """Build convert_from_path arguments for writing pages directly to output_dir."""
+        return {
+            "dpi": self.dpi,
+            "output_folder": str(output_dir),
+            "output_file": f"_pdf2image_{first_page:03d}_",
+            "fmt": self.output_format,
+            "paths_only": True,
+            "thread_count": self.max_workers,
+        }
+
+    def _collect_written_pages(
+        self,
+        paths: List[str],
+        first_page: int,
+        output_dir: Path,
+        pages_set: Optional[set] = None
+    ) -> List[PDFPage]:
+        """
+        Rename files written by pdf2image to the page_NNN naming scheme.
+        
+        Pages outside pages_set (written because they fell inside a chunk)
+        are removed again.
+        """
+        result = []
+        for i, path in enumerate(paths):
+            page_num = first_page + i
+            if pages_set and page_num not in pages_set:
+                os.remove(path)
+                continue
+
+            image_path = output_dir / f"page_{page_num:03d}.{self.output_format}"
+            os.replace(path, image_path)
+            result.append(PDFPage(page_number=page_num, image_path=str(image_path)))
+
+        return result
     
     def get_pdf_info(self, pdf_path: str) -> dict:
         """
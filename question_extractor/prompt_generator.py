@@ -1,83 +1,18 @@
 import os
-from pathlib import Path
 from typing import List, Dict, Optional
 from question_extractor.topic_manager import TopicManager
 
-class PromptGenerator:
-    """Generates prompts for AI-powered question extraction."""
-
-    def __init__(self, topic_manager: TopicManager):
-        self.topic_manager = topic_manager
-
-    def generate_extraction_prompt(
-        self, 
-        topics: List[str] = None,
-        include_examples: bool = True,
-        page_number: int = None,
-        is_batch_mode: bool = False
-    ) -> str:
-        """
-        Generate a prompt for AI-powered question extraction.
-        
-        This prompt can be used with vision-capable AI models like
-        Claude or Gemini to extract questions from PDF images.
-        
-        Args:
-            topics: List of topic names to extract (None = use enabled topics)
-            include_examples: Whether to include example output format
-            page_number: Optional page number for context
-            is_batch_mode: If True, generates a more thorough prompt for batch processing
-            
-        Returns:
-            Formatted prompt string
-        """
-        if topics is None:
-            enabled = self.topic_manager.get_enabled_topics()
-            topics = list(enabled.keys())
-        
-        # Build comprehensive topic descriptions with ALL keywords
-        topic_descriptions = []
-        all_topics = self.topic_manager.get_all_topics()
-        for topic_name in topics:
-            if topic_name in all_topics:
-                topic_data = all_topics[topic_name]
-                # Include ALL keywords for comprehensive matching
-                keywords = ", ".join(topic_data.get("keywords", []))
-                subtopics = topic_data.get("subtopics", [])
-                subtopics_str = ", ".join(subtopics) if subtopics else "N/A"
-                unit = topic_data.get("unit", "Unknown")
-                formulas = topic_data.get("formulas", [])
-                formulas_str = "; ".join(formulas[:5]) if formulas else ""
-                edge_cases = topic_data.get("edge_cases", [])
-                
-                desc = f"""
-### {topic_name} ({topic_data.get('full_name', topic_name)})
-- **Unit**: {unit}
-- **Keywords**: {keywords}
-- **Subtopics**: {subtopics_str}"""
-                if formulas_str:
-                    desc += f"\n- **Common Formulas**: {formulas_str}"
-                if edge_cases:
-                    desc += f"\n- **Look for**: {', '.join(edge_cases[:3])}"
-                
-                topic_descriptions.append(desc)
-        
-        settings = self.topic_manager.get_extraction_settings()
-        
-        page_context = f" (Page {page_number})" if page_number else ""
-        
-        board = self.topic_manager.get_syllabus_info().get('board', 'ICSE')
-        class_num = self.topic_manager.get_syllabus_info().get('class', '10')
-        
-        prompt = f"""
-# {board} Class {class_num} Mathematics Question Extraction{page_context}
+# Prompt sections that do not depend on the topic selection or page; built once
+_TASK_SECTION = """
 
 ## YOUR TASK
 You MUST extract **EVERY SINGLE QUESTION** from this page that belongs to ANY of the following topics. 
 Do NOT skip any question. Even if a question only partially relates to a topic, include it.
 
 ## TARGET TOPICS (Extract ALL questions matching these):
-{chr(10).join(topic_descriptions)}
+"""
+
+_RULES_SECTION = """
 
 ## EXTRACTION RULES - FOLLOW EXACTLY:
 
@@ -109,9 +44,8 @@ Do NOT skip any question. Even if a question only partially relates to a topic,
    - Shares/Dividends: Shares, dividends, nominal value, market value, premium, discount, investment
 
 """
-        
-        if include_examples:
-            prompt += """
+
+_EXAMPLES_SECTION = """
 ## OUTPUT FORMAT (JSON) - One entry per question/sub-question:
 ```json
 {
@@ -147,6 +81,92 @@ Do NOT skip any question. Even if a question only partially relates to a topic,
 - Include ALL options for MCQs
 - Include ALL parts (a, b, c) for descriptive questions
 """
+
+
+class PromptGenerator:
+    """Generates prompts for AI-powered question extraction."""
+
+    def __init__(self, topic_manager: TopicManager):
+        self.topic_manager = topic_manager
+        # Syllabus metadata is fixed for a run; look it up once
+        self._syllabus = topic_manager.get_syllabus_info()
+        board = self._syllabus.get('board', 'ICSE')
+        class_num = self._syllabus.get('class', '10')
+        self._title = f"\n# {board} Class {class_num} Mathematics Question Extraction"
+        # Rendered topic descriptions, valid while topic_manager.version is unchanged
+        self._topic_blocks: Dict[str, str] = {}
+        self._topics_version = getattr(topic_manager, "version", None)
+
+    def _describe_topic(self, topic_name: str, topic_data) -> str:
+        """Render the markdown description of one topic (ALL keywords included)."""
+        subtopics = topic_data.get("subtopics")
+        parts = [
+            f"\n### {topic_name} ({topic_data.get('full_name', topic_name)})",
+            f"\n- **Unit**: {topic_data.get('unit', 'Unknown')}",
+            f"\n- **Keywords**: {', '.join(topic_data.get('keywords', []))}",
+            f"\n- **Subtopics**: {', '.join(subtopics) if subtopics else 'N/A'}",
+        ]
+        formulas = topic_data.get("formulas")
+        if formulas:
+            parts.append(f"\n- **Common Formulas**: {'; '.join(formulas[:5])}")
+        edge_cases = topic_data.get("edge_cases")
+        if edge_cases:
+            parts.append(f"\n- **Look for**: {', '.join(edge_cases[:3])}")
+        return "".join(parts)
+
+    def generate_extraction_prompt(
+        self, 
+        topics: List[str] = None,
+        include_examples: bool = True,
+        page_number: int = None,
+        is_batch_mode: bool = False
+    ) -> str:
+        """
+        Generate a prompt for AI-powered question extraction.
+        
+        This prompt can be used with vision-capable AI models like
+        Claude or Gemini to extract questions from PDF images.
+        
+        Args:
+            topics: List of topic names to extract (None = use enabled topics)
+            include_examples: Whether to include example output format
+            page_number: Optional page number for context
+            is_batch_mode: If True, generates a more thorough prompt for batch processing
+            
+        Returns:
+            Formatted prompt string
+        """
+        if topics is None:
+            enabled = self.topic_manager.get_enabled_topics()
+            topics = list(enabled.keys())
+        
+        # Topic descriptions only change when the topic config does
+        version = getattr(self.topic_manager, "version", None)
+        if version != self._topics_version:
+            self._topic_blocks.clear()
+            self._topics_version = version
+
+        topic_descriptions = []
+        all_topics = None
+        for topic_name in topics:
+            block = self._topic_blocks.get(topic_name)
+            if block is None:
+                if all_topics is None:
+                    all_topics = self.topic_manager.get_all_topics()
+                topic_data = all_topics.get(topic_name)
+                if topic_data is None:
+                    continue
+                block = self._topic_blocks[topic_name] = self._describe_topic(topic_name, topic_data)
+            topic_descriptions.append(block)
+        
+        topic_block = "\n".join(topic_descriptions)
+
+        page_context = f" (Page {page_number})" if page_number else ""
+        prompt = "".join((
+            self._title, page_context, _TASK_SECTION, topic_block, _RULES_SECTION
+        ))
+        if include_examples:
+            prompt += _EXAMPLES_SECTION
         
         return prompt
 
@@ -195,7 +215,9 @@ Do NOT skip any question. Even if a question only partially relates to a topic,
                     return 0
             
             image_paths.sort(key=get_page_num)
-            image_paths = [str(Path(p).absolute()) for p in image_paths]
+            # Resolve CWD once instead of building a Path per image
+            cwd = os.getcwd()
+            image_paths = [p if os.path.isabs(p) else os.path.join(cwd, p) for p in image_paths]
         else:
             image_paths = image_provider_func(images_dir)
         
@@ -209,27 +231,35 @@ Do NOT skip any question. Even if a question only partially relates to a topic,
             include_examples=True
         )
 
+        if recursive:
+            # Sibling pages share a parent directory, so cache its name per directory
+            parent_names = {}
+            page_sources = []
+            for img_path in image_paths:
+                parent_dir = os.path.dirname(img_path)
+                page_source = parent_names.get(parent_dir)
+                if page_source is None:
+                    page_source = parent_names[parent_dir] = os.path.basename(parent_dir)
+                page_sources.append(page_source)
+        else:
+            page_sources = [source_paper] * len(image_paths)
+
         manifest = {
             "source_paper": source_paper,
             "images_directory": str(images_dir),
             "total_pages": len(image_paths),
             "target_topics": topics,
             "extraction_prompt": extraction_prompt,
-            "pages": []
+            "pages": [
+                {
+                    "page_number": idx,
+                    "image_path": img_path,
+                    "source_paper": page_source,
+                    "status": "pending",
+                    "questions_extracted": 0
+                }
+                for idx, (img_path, page_source) in enumerate(zip(image_paths, page_sources), 1)
+            ]
         }
         
-        for idx, img_path in enumerate(image_paths, 1):
-            page_source = source_paper
-            if recursive:
-                page_source = Path(img_path).parent.name
-
-            page_info = {
-                "page_number": idx,
-                "image_path": img_path,
-                "source_paper": page_source,
-                "status": "pending",
-                "questions_extracted": 0
-            }
-            manifest["pages"].append(page_info)
-        
         return manifest
@@ -1,19 +1,18 @@
 
+import io
 import os
+import re
 import sys
-import subprocess
-import shutil
+from contextlib import redirect_stdout
 from pathlib import Path
 
-# Add parent directory to path to allow imports if needed
-sys.path.append(str(Path(__file__).parent.parent))
+from question_extractor import extractor
 
 def test_append_feature():
     print("Running append feature test...")
 
     # Setup paths
     base_dir = Path(__file__).parent
-    extractor_script = base_dir / "extractor.py"
     target_file = base_dir / "test_target_bank.txt"
     json_input = base_dir / "test_input.json"
 
@@ -48,8 +47,7 @@ SUMMARY
   Total questions: 1
 ======================================================================
 """
-    with open(target_file, "w", encoding="utf-8") as f:
-        f.write(initial_content)
+    target_file.write_text(initial_content, encoding="utf-8")
 
     # 2. Create JSON input
     json_content = """
@@ -74,56 +72,45 @@ SUMMARY
   ]
 }
 """
-    with open(json_input, "w", encoding="utf-8") as f:
-        f.write(json_content)
+    json_input.write_text(json_content, encoding="utf-8")
 
-    # 3. Run command
-    cmd = [
-        sys.executable,
-        str(extractor_script),
+    # 3. Run command in-process
+    argv = [
         "--append-results", str(json_input),
         "--target", str(target_file),
         "--quiet"
     ]
 
-    try:
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
-    except subprocess.CalledProcessError as e:
-        print(f"Error running command: {e}")
-        print(f"Stderr: {e.stderr}")
+    output = io.StringIO()
+    with redirect_stdout(output):
+        exit_code = extractor.main(argv)
+    if exit_code != 0:
+        print(f"Error running command: exit code {exit_code}")
+        print(f"Output: {output.getvalue()}")
         return False
 
     # 4. Verify content
-    with open(target_file, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = target_file.read_text(encoding="utf-8")
 
     print("\n--- Final File Content Preview ---")
     print(content[-500:])
     print("----------------------------------\n")
 
-    # Check if Q2 and Q3 are present
-    if "Find the roots of" not in content:
-        print("FAIL: Q2 text not found")
-        return False
-    if "Define a matrix" not in content:
-        print("FAIL: Q3 text not found")
-        return False
-
-    # Check if Summary was updated
-    if "Quadratic Equations: 2 questions" not in content: # 1 initial + 1 new
-        print("FAIL: Quadratic Equations count incorrect in summary")
-        return False
-    if "Matrices: 1 questions" not in content:
-        print("FAIL: Matrices count incorrect in summary")
-        return False
-    if "Total questions: 3" not in content:
-        print("FAIL: Total questions count incorrect")
-        return False
-
-    # Check if old Q1 is still there
-    if "Solve x^2 - 4 = 0" not in content:
-        print("FAIL: Original Q1 lost")
-        return False
+    # Check all expected snippets in a single pass over the content
+    expected = {
+        "Find the roots of": "Q2 text not found",
+        "Define a matrix": "Q3 text not found",
+        "Quadratic Equations: 2 questions": "Quadratic Equations count incorrect in summary",  # 1 initial + 1 new
+        "Matrices: 1 questions": "Matrices count incorrect in summary",
+        "Total questions: 3": "Total questions count incorrect",
+        "Solve x^2 - 4 = 0": "Original Q1 lost",
+    }
+    pattern = re.compile("|".join(re.escape(needle) for needle in expected))
+    found = set(pattern.findall(content))
+    for needle, message in expected.items():
+        if needle not in found:
+            print(f"FAIL: {message}")
+            return False
 
     # Cleanup
     os.remove(target_file)
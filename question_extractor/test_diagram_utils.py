@@ -1,19 +1,18 @@
 import unittest
 import os
-import shutil
+import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from question_extractor.diagram_utils import ensure_output_directory, create_diagram
 
 class TestDiagramUtils(unittest.TestCase):
     def setUp(self):
-        self.test_dir = Path("./test_output_utils")
-        if self.test_dir.exists():
-            shutil.rmtree(self.test_dir)
+        self._td = tempfile.TemporaryDirectory()
+        # Not created yet, so tests can exercise directory creation
+        self.test_dir = Path(self._td.name) / "output"
 
     def tearDown(self):
-        if self.test_dir.exists():
-            shutil.rmtree(self.test_dir)
+        self._td.cleanup()
 
     def test_ensure_output_directory(self):
         """Test directory creation."""
@@ -1,27 +1,36 @@
 import unittest
+import copy
 import os
-import shutil
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 from question_extractor.extractor import QuestionExtractor, ExtractedQuestion
 
 class TestQuestionExtractor(unittest.TestCase):
-    def setUp(self):
-        self.tm_patcher = patch("question_extractor.extractor.TopicManager")
-        self.MockTopicManager = self.tm_patcher.start()
+    # Per-test mutable state, restored from a pristine copy in setUp
+    MUTABLE_ATTRS = ("extracted_questions", "_existing_signatures", "processed_pages", "questions_by_paper")
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tm_patcher = patch("question_extractor.extractor.TopicManager")
+        cls.MockTopicManager = cls.tm_patcher.start()
         
         # Configure mock to avoid FileNotFoundError during init
-        self.MockTopicManager.return_value.config_path.exists.return_value = True
+        cls.MockTopicManager.return_value.config_path.exists.return_value = True
         
-        # Create a dummy config for testing if needed, or mock TopicManager
-        self.extractor = QuestionExtractor(profile="test_profile")
-        # Mock dependencies to avoid actual file I/O or external calls
-        self.extractor.pdf_processor = MagicMock()
+        # Build the extractor once; nothing in __init__ varies between tests
+        cls.extractor = QuestionExtractor(profile="test_profile")
         # self.extractor.topic_manager is already mocked by the patcher, but we can refine it
-        self.extractor.topic_manager = self.MockTopicManager.return_value
+        cls.extractor.topic_manager = cls.MockTopicManager.return_value
+        cls._initial_state = {name: getattr(cls.extractor, name) for name in cls.MUTABLE_ATTRS}
 
-    def tearDown(self):
-        self.tm_patcher.stop()
+    @classmethod
+    def tearDownClass(cls):
+        cls.tm_patcher.stop()
+
+    def setUp(self):
+        for name, value in self._initial_state.items():
+            setattr(self.extractor, name, copy.copy(value))
+        # Mock dependencies to avoid actual file I/O or external calls
+        self.extractor.pdf_processor = MagicMock()
 
     def test_check_dependencies(self):
         """Test dependency checking."""
@@ -36,5 +36,15 @@ class TestFigureRendererSolver(unittest.TestCase):
         self.assertEqual(positions["C"], (5.0, 0.0))
         self.assertEqual(positions["D"], (2.5, 0.0))
 
+    def test_order_description_tasks(self):
+        # Each task comes after the described points it uses
+        tasks = [("D", ["A", "C"], "d"), ("C", ["A", "B"], "c1"), ("E", ["D"], "e"), ("C", ["B"], "c2")]
+        ordered = PointLayoutEngine._order_description_tasks(tasks)
+        self.assertEqual([solver for _, _, solver in ordered], ["c1", "c2", "d", "e"])
+
+        # A cycle can't be ordered, so the tasks are returned as given
+        cyclic = [("P", ["Q"], "p"), ("Q", ["P"], "q")]
+        self.assertEqual(PointLayoutEngine._order_description_tasks(cyclic), cyclic)
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,12 @@
 
 import unittest
 import os
-import shutil
+import tempfile
+import types
 from pathlib import Path
-from question_extractor.pdf_processor import PDFProcessor
+from unittest.mock import patch
+from question_extractor.pdf_processor import PDFProcessor, PDFPage
+from question_extractor._pdf_fixture import write_fixture
 import sys
 
 # Ensure reportlab is available for test generation
@@ -19,21 +22,13 @@ class TestPDFProcessor(unittest.TestCase):
             raise unittest.SkipTest("Reportlab not installed")
 
         cls.pdf_path = "test_processor_fixture.pdf"
-        cls.generate_pdf(cls.pdf_path, 10)
+        write_fixture(cls.pdf_path, 10)
 
     @classmethod
     def tearDownClass(cls):
         if os.path.exists(cls.pdf_path):
             os.remove(cls.pdf_path)
 
-    @classmethod
-    def generate_pdf(cls, filename, pages=10):
-        c = canvas.Canvas(filename)
-        for i in range(pages):
-            c.drawString(100, 750, f"Page {i+1}")
-            c.showPage()
-        c.save()
-
     def test_pages_provided(self):
         """Test processing specific pages (Optimization path)"""
         processor = PDFProcessor()
@@ -50,7 +45,7 @@ class TestPDFProcessor(unittest.TestCase):
 
     def test_pages_none(self):
         """Test processing all pages (Standard path)"""
-        processor = PDFProcessor()
+        processor = PDFProcessor(max_workers=4)
         pages = processor.convert_pdf_to_images(self.pdf_path)
         self.assertEqual(len(pages), 10)
         self.assertEqual(pages[0].page_number, 1)
@@ -90,5 +85,56 @@ class TestPDFProcessor(unittest.TestCase):
             processor = PDFProcessor()
             self.assertEqual(processor._backend, 'none')
 
+class TestPDFPage(unittest.TestCase):
+    def test_image_base64_is_lazy(self):
+        """Base64 is derived from raw bytes only when asked for."""
+        page = PDFPage(page_number=1, image_bytes=b"png-data")
+        self.assertNotIn("image_base64", vars(page))
+        self.assertEqual(page.image_base64, "cG5nLWRhdGE=")
+        self.assertIsNone(PDFPage(page_number=2).image_base64)
+
+class TestPdf2ImageDiskOutput(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.pdf_path = self.tmp / "paper.pdf"
+        self.pdf_path.write_bytes(b"%PDF-1.4")
+        self.output_dir = self.tmp / "out"
+        self.calls = []
+
+    def _convert_from_path(self, pdf_path, first_page=1, last_page=3, **kwargs):
+        """Mimic pdf2image(paths_only=True): write one file per page, return paths in order."""
+        self.calls.append(kwargs)
+        paths = []
+        for n in range(first_page, last_page + 1):
+            path = Path(kwargs["output_folder"]) / f"{kwargs['output_file']}{n}.{kwargs['fmt']}"
+            path.write_bytes(b"page %d" % n)
+            paths.append(str(path))
+        return paths
+
+    def _convert(self, pages=None):
+        fake = types.ModuleType("pdf2image")
+        fake.convert_from_path = self._convert_from_path
+        fake.pdfinfo_from_path = lambda path: {"Pages": 3}
+        processor = PDFProcessor()
+        processor._backend = "pdf2image"
+        with patch.dict(sys.modules, {"pdf2image": fake}):
+            return processor.convert_pdf_to_images(str(self.pdf_path), str(self.output_dir), pages=pages)
+
+    def test_pages_renamed_in_order(self):
+        result = self._convert()
+        self.assertTrue(self.calls[0]["paths_only"])
+        self.assertEqual([page.page_number for page in result], [1, 2, 3])
+        for page in result:
+            self.assertEqual(Path(page.image_path).name, f"page_{page.page_number:03d}.png")
+            self.assertEqual(Path(page.image_path).read_bytes(), b"page %d" % page.page_number)
+        self.assertEqual(sorted(os.listdir(self.output_dir)), ["page_001.png", "page_002.png", "page_003.png"])
+
+    def test_unrequested_pages_removed(self):
+        result = self._convert(pages=[1, 3])
+        self.assertEqual([page.page_number for page in result], [1, 3])
+        self.assertEqual(sorted(os.listdir(self.output_dir)), ["page_001.png", "page_003.png"])
+
 if __name__ == '__main__':
     unittest.main()
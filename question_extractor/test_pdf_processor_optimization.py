@@ -1,7 +1,7 @@
 
 import unittest
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 from pathlib import Path
 
 # Add parent directory to path to import pdf_processor
@@ -9,11 +9,50 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from question_extractor.pdf_processor import PDFProcessor
 
+
+class _FakeExecutor:
+    """Stand-in for ProcessPoolExecutor that runs nothing and returns no results."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, fn, *iterables, **kwargs):
+        return []
+
+
+class _FakeDocument:
+    """Minimal fitz document: a context manager with a page count."""
+
+    def __init__(self, page_count):
+        self.page_count = page_count
+        self.entered = False
+        self.exited = False
+
+    def __enter__(self):
+        self.entered = True
+        return self
+
+    def __exit__(self, *exc_info):
+        self.exited = True
+        return False
+
+    def __len__(self):
+        return self.page_count
+
+
 class TestPDFProcessorOptimization(unittest.TestCase):
-    def setUp(self):
-        self.processor = PDFProcessor()
+    @classmethod
+    def setUpClass(cls):
+        # The processor is not mutated by the tests, so one instance serves them all
+        cls.processor = PDFProcessor()
         # Force backend to pymupdf for these tests
-        self.processor._backend = "pymupdf"
+        cls.processor._backend = "pymupdf"
 
     @patch('pathlib.Path.exists')
     @patch('fitz.open')
@@ -23,13 +62,8 @@ class TestPDFProcessorOptimization(unittest.TestCase):
         pdf_path = "test.pdf"
         page_count = 10
 
-        # Mock executor to avoid actually running tasks
-        with patch('concurrent.futures.ProcessPoolExecutor') as mock_executor:
-            # Setup mock future
-            mock_executor_instance = mock_executor.return_value
-            mock_executor_instance.__enter__.return_value = mock_executor_instance
-            mock_executor_instance.map.return_value = [] # Return empty list
-
+        # Fake executor to avoid actually running tasks
+        with patch('concurrent.futures.ProcessPoolExecutor', _FakeExecutor):
             # Call with page_count
             self.processor.convert_pdf_to_images(
                 pdf_path,
@@ -52,17 +86,12 @@ class TestPDFProcessorOptimization(unittest.TestCase):
         mock_exists.return_value = True
         pdf_path = "test.pdf"
 
-        # Mock the document object returned by context manager
-        mock_doc = MagicMock()
-        mock_doc.__len__.return_value = 5
-        mock_fitz_open.return_value.__enter__.return_value = mock_doc
-
-        # Mock executor
-        with patch('concurrent.futures.ProcessPoolExecutor') as mock_executor:
-            mock_executor_instance = mock_executor.return_value
-            mock_executor_instance.__enter__.return_value = mock_executor_instance
-            mock_executor_instance.map.return_value = []
+        # Fake document returned by fitz.open and used as a context manager
+        fake_doc = _FakeDocument(5)
+        mock_fitz_open.return_value = fake_doc
 
+        # Fake executor
+        with patch('concurrent.futures.ProcessPoolExecutor', _FakeExecutor):
             # Call without page_count
             self.processor.convert_pdf_to_images(pdf_path)
 
@@ -70,8 +99,8 @@ class TestPDFProcessorOptimization(unittest.TestCase):
             mock_fitz_open.assert_called_once_with(str(Path(pdf_path)))
 
             # Verify context manager usage
-            mock_fitz_open.return_value.__enter__.assert_called()
-            mock_fitz_open.return_value.__exit__.assert_called()
+            self.assertTrue(fake_doc.entered)
+            self.assertTrue(fake_doc.exited)
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,11 +1,12 @@
 import unittest
+import os
+import tempfile
 from unittest.mock import MagicMock
 from question_extractor.prompt_generator import PromptGenerator
 
 class TestPromptGenerator(unittest.TestCase):
     def setUp(self):
         self.topic_manager = MagicMock()
-        self.generator = PromptGenerator(self.topic_manager)
         
         # Setup mock topic data
         self.topic_manager.get_all_topics.return_value = {
@@ -27,6 +28,7 @@ class TestPromptGenerator(unittest.TestCase):
         }
         self.topic_manager.get_extraction_settings.return_value = {}
         self.topic_manager.get_syllabus_info.return_value = {"board": "TEST", "class": "99"}
+        self.generator = PromptGenerator(self.topic_manager)
 
     def test_generate_extraction_prompt_specific_topics(self):
         """Test prompt generation with specific topics."""
@@ -47,5 +49,36 @@ class TestPromptGenerator(unittest.TestCase):
         # Mock says only Topic1 is enabled
         self.assertNotIn("Full Topic 2", prompt)
 
+    def test_topic_block_cache_follows_version(self):
+        """Topic descriptions are re-rendered only after the topic config version changes."""
+        self.topic_manager.version = 0
+        self.generator.generate_extraction_prompt(topics=["Topic1"])
+        self.topic_manager.get_all_topics.return_value["Topic1"]["full_name"] = "Renamed Topic 1"
+
+        prompt = self.generator.generate_extraction_prompt(topics=["Topic1"])
+        self.assertIn("Full Topic 1", prompt)
+
+        self.topic_manager.version = 1
+        prompt = self.generator.generate_extraction_prompt(topics=["Topic1"])
+        self.assertIn("Renamed Topic 1", prompt)
+
+    def test_batch_manifest_recursive(self):
+        """Test recursive manifest uses absolute paths and folder names as sources."""
+        with tempfile.TemporaryDirectory() as tmp:
+            for paper in ("ICSE 2023", "ICSE 2024"):
+                os.mkdir(os.path.join(tmp, paper))
+                for n in (2, 1):
+                    open(os.path.join(tmp, paper, f"page_{n:03d}.png"), "wb").close()
+
+            manifest = self.generator.generate_batch_extraction_manifest(
+                tmp, None, topics=["Topic1"], recursive=True
+            )
+
+        self.assertEqual(manifest["total_pages"], 4)
+        for page in manifest["pages"]:
+            self.assertTrue(os.path.isabs(page["image_path"]))
+            self.assertEqual(page["source_paper"], os.path.basename(os.path.dirname(page["image_path"])))
+        self.assertTrue(manifest["pages"][0]["image_path"].endswith("page_001.png"))
+
 if __name__ == '__main__':
     unittest.main()
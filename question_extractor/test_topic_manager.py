@@ -1,44 +1,46 @@
 import unittest
 import json
-import os
 import shutil
+import tempfile
 from pathlib import Path
 from question_extractor.topic_manager import TopicManager
 
 class TestTopicManager(unittest.TestCase):
-    def setUp(self):
-        self.test_config_dir = Path("./test_configs")
-        self.test_config_dir.mkdir(exist_ok=True)
-        self.config_path = self.test_config_dir / "test_profile.json"
+    @classmethod
+    def setUpClass(cls):
+        # The config is only read, so write it and build the manager once per class
+        cls.test_config_dir = Path(tempfile.mkdtemp())
+        cls.config_path = cls.test_config_dir / "test_profile.json"
         
-        self.sample_config = {
+        cls.sample_config = {
             "syllabus_info": {"board": "TEST"},
             "units": {
                 "Unit1": {
                     "enabled": True,
                     "topics": {
-                        "Topic1": {"enabled": True, "full_name": "Test Topic 1"},
+                        "Topic1": {"enabled": True, "full_name": "Test Topic 1", "keywords": ["kw1"]},
                         "Topic2": {"enabled": False, "full_name": "Test Topic 2"}
                     }
                 }
             }
         }
         
-        with open(self.config_path, 'w') as f:
-            json.dump(self.sample_config, f)
+        with open(cls.config_path, 'w') as f:
+            json.dump(cls.sample_config, f)
 
-    def tearDown(self):
-        if self.test_config_dir.exists():
-            shutil.rmtree(self.test_config_dir)
+        cls.manager = TopicManager(config_path=str(cls.config_path))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.test_config_dir, ignore_errors=True)
 
     def test_init_load(self):
         """Test initializing and loading config."""
-        manager = TopicManager(config_path=str(self.config_path))
-        self.assertEqual(manager.get_syllabus_info()["board"], "TEST")
+        self.assertEqual(self.manager.get_syllabus_info()["board"], "TEST")
 
     def test_get_topics(self):
         """Test retrieving topics."""
-        manager = TopicManager(config_path=str(self.config_path))
+        manager = self.manager
         
         # Test enabled topics
         enabled = manager.get_enabled_topics()
@@ -52,7 +54,12 @@ class TestTopicManager(unittest.TestCase):
 
     def test_enable_disable(self):
         """Test enabling and disabling topics."""
-        manager = TopicManager(config_path=str(self.config_path))
+        manager = self.manager
+        # The manager is shared by the class, so put the enabled flags back afterwards
+        was_enabled = set(manager.get_enabled_topics())
+        for topic in manager.get_all_topics():
+            restore = manager.enable_topic if topic in was_enabled else manager.disable_topic
+            self.addCleanup(restore, topic)
         
         # Enable Topic2
         manager.enable_topic("Topic2")
@@ -62,5 +69,28 @@ class TestTopicManager(unittest.TestCase):
         manager.disable_topic("Topic1")
         self.assertNotIn("Topic1", manager.get_enabled_topics())
 
+    def test_cached_config_not_shared_after_edit(self):
+        """Edits on one manager don't leak into others loaded from the same file."""
+        first = TopicManager(config_path=str(self.config_path))
+        second = TopicManager(config_path=str(self.config_path))
+        
+        first.enable_topic("Topic2")
+        self.assertIn("Topic2", first.get_enabled_topics())
+        self.assertNotIn("Topic2", second.get_enabled_topics())
+        self.assertNotIn("Topic2", TopicManager(config_path=str(self.config_path)).get_enabled_topics())
+
+    def test_returned_values_not_shared(self):
+        """Mutating what one manager's accessors return doesn't leak into other managers."""
+        first = TopicManager(config_path=str(self.config_path))
+        first.get_syllabus_info()["board"] = "LEAK"
+        first.get_all_units()["Unit1"]["enabled"] = False
+        first.get_topic_keywords("Topic1").append("LEAK")
+        first.get_topic_by_name("Topic1")["keywords"].append("LEAK")
+        
+        fresh = TopicManager(config_path=str(self.config_path))
+        self.assertEqual(fresh.get_syllabus_info()["board"], "TEST")
+        self.assertIn("Topic1", fresh.get_enabled_topics())
+        self.assertEqual(fresh.get_topic_keywords("Topic1"), ["kw1"])
+
 if __name__ == '__main__':
     unittest.main()
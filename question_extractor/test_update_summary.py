@@ -1,8 +1,6 @@
 import unittest
 import os
-import shutil
 import re
-from pathlib import Path
 import sys
 
 # Add parent directory to path
@@ -14,17 +12,8 @@ except ImportError:
     sys.path.append('question_extractor')
     from update_summary import update_file_summary
 
-class TestUpdateSummary(unittest.TestCase):
-    def setUp(self):
-        self.test_file = "test_summary_update.txt"
-
-    def tearDown(self):
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
-
-    def test_update_summary_counts(self):
-        # Create a file with incorrect counts
-        content = """
+# Topic sections with wrong header and summary counts
+SAMPLE_CONTENT = """
 Topic: Algebra
 Number of Questions: 0
 --------------------------------------------------
@@ -51,6 +40,18 @@ SUMMARY
   Geometry: 999 questions
 =======
 """
+
+class TestUpdateSummary(unittest.TestCase):
+    def setUp(self):
+        self.test_file = "test_summary_update.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.test_file):
+            os.remove(self.test_file)
+
+    def test_update_summary_counts(self):
+        # Create a file with incorrect counts
+        content = SAMPLE_CONTENT
         with open(self.test_file, 'w', encoding='utf-8') as f:
             f.write(content)
 
@@ -68,5 +69,34 @@ SUMMARY
         self.assertIn("Geometry: 3 questions", new_content)
         self.assertIn("Total questions: 5", new_content)
 
+    def test_separator_on_header_line(self):
+        # "SUMMARY =======" on one line is still found; the counts are updated
+        content = SAMPLE_CONTENT.replace("SUMMARY\n=======\n", "SUMMARY =======\n  Total questions: 0\n")
+        with open(self.test_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+        update_file_summary(self.test_file)
+
+        with open(self.test_file, 'r', encoding='utf-8') as f:
+            new_content = f.read()
+
+        self.assertRegex(new_content, r'Topic: Geometry\nNumber of Questions: 3')
+        self.assertIn("SUMMARY =======\n  Total questions: 5\n", new_content)
+
+    def test_up_to_date_file_not_rewritten(self):
+        with open(self.test_file, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_CONTENT)
+        update_file_summary(self.test_file)
+
+        with open(self.test_file, 'r', encoding='utf-8') as f:
+            updated = f.read()
+        os.utime(self.test_file, ns=(0, 0))
+
+        update_file_summary(self.test_file)
+
+        self.assertEqual(os.stat(self.test_file).st_mtime_ns, 0)
+        with open(self.test_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), updated)
+
 if __name__ == '__main__':
     unittest.main()
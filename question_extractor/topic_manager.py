@@ -1,10 +1,81 @@
+import copy
+import functools
 import json
 import os
+from collections.abc import Mapping
 from pathlib import Path
 from typing import List, Dict, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=32)
+def _read_profile(path_str: str, mtime_ns: int, size: int) -> dict:
+    """
+    Read and parse a config file. Keyed on (path, mtime, size) so repeated loads
+    of an unchanged profile are a dict lookup. The result is shared: callers
+    must copy it before mutating.
+    """
+    data = Path(path_str).read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _dump_profile(config: dict) -> bytes:
+    """Serialize a config as UTF-8 JSON with 2-space indentation."""
+    if orjson:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _load_profile(path: Path) -> dict:
+    """Load a config file through the per-(path, mtime) cache, as the caller's own copy."""
+    stat = path.stat()
+    return copy.deepcopy(_read_profile(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+class TopicView(Mapping):
+    """
+    Read-only view of a topic's config with its unit info ("unit", "unit_key")
+    layered on top, so topic dicts don't need to be copied to add them.
+    """
+    __slots__ = ("_topic", "_unit", "_unit_key")
+    _UNIT_KEYS = ("unit", "unit_key")
+
+    def __init__(self, topic: dict, unit: str, unit_key: str):
+        self._topic = topic
+        self._unit = unit
+        self._unit_key = unit_key
+
+    def __getitem__(self, key):
+        if key == "unit":
+            return self._unit
+        if key == "unit_key":
+            return self._unit_key
+        return self._topic[key]
+
+    def __iter__(self):
+        yield from self._topic
+        for key in self._UNIT_KEYS:
+            if key not in self._topic:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self._topic) + sum(key not in self._topic for key in self._UNIT_KEYS)
+
+    def __repr__(self) -> str:
+        return f"TopicView({dict(self)!r})"
+
+
 class TopicManager:
     """Manages topic configuration and filtering for ICSE syllabus."""
+
+    __slots__ = (
+        "config_path", "config", "_index",
+        "_all_topics_cache", "_enabled_topics_cache", "version",
+    )
     
     def __init__(self, profile: str = "class_10", config_path: str = None):
         """
@@ -22,8 +93,11 @@ class TopicManager:
         
         self.config_path = Path(config_path)
         self.config = self._load_config()
+        self._index = self._build_index()
         self._all_topics_cache = None
         self._enabled_topics_cache = None
+        # Bumped on every config change so dependents (e.g. PromptGenerator) can drop caches
+        self.version = 0
     
     def _load_config(self) -> dict:
         """Load configuration from JSON file."""
@@ -32,16 +106,27 @@ class TopicManager:
             old_path = Path(__file__).parent / "topics_config.json"
             if old_path.exists():
                 print(f"Warning: Config not found at {self.config_path}, falling back to topics_config.json")
-                with open(old_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return _load_profile(old_path)
                 
             raise FileNotFoundError(
                 f"Topic configuration not found: {self.config_path}\n"
                 f"Please ensure configs/{self.config_path.name} exists."
             )
         
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _load_profile(self.config_path)
+
+    def _build_index(self) -> list:
+        """
+        Flatten the units/topics tree into (unit_key, unit_name, unit_enabled,
+        topic_key, topic_data) rows; the topic views are derived from this.
+        """
+        index = []
+        for unit_key, unit_data in self.config.get("units", {}).items():
+            unit_name = unit_data.get("unit_name", unit_key)
+            unit_enabled = unit_data.get("enabled", True)
+            for topic_key, topic_data in unit_data.get("topics", {}).items():
+                index.append((unit_key, unit_name, unit_enabled, topic_key, topic_data))
+        return index
     
     def get_syllabus_info(self) -> dict:
         """Get syllabus metadata."""
@@ -51,45 +136,30 @@ class TopicManager:
         """Get all units in the syllabus."""
         return self.config.get("units", {})
     
-    def get_enabled_topics(self) -> Dict[str, dict]:
+    def get_enabled_topics(self) -> Dict[str, TopicView]:
         """Get all topics that are enabled across all units."""
         if self._enabled_topics_cache is not None:
             return self._enabled_topics_cache
 
-        enabled = {}
-        units = self.config.get("units", {})
-        
-        for unit_key, unit_data in units.items():
-            if not unit_data.get("enabled", True):
-                continue
-            
-            topics = unit_data.get("topics", {})
-            for topic_key, topic_data in topics.items():
-                if topic_data.get("enabled", True):
-                    # Add unit info to topic
-                    topic_with_unit = topic_data.copy()
-                    topic_with_unit["unit"] = unit_data.get("unit_name", unit_key)
-                    topic_with_unit["unit_key"] = unit_key
-                    enabled[topic_key] = topic_with_unit
+        # Add unit info to each topic
+        enabled = {
+            topic_key: TopicView(topic_data, unit_name, unit_key)
+            for unit_key, unit_name, unit_enabled, topic_key, topic_data in self._index
+            if unit_enabled and topic_data.get("enabled", True)
+        }
         
         self._enabled_topics_cache = enabled
         return enabled
     
-    def get_all_topics(self) -> Dict[str, dict]:
+    def get_all_topics(self) -> Dict[str, TopicView]:
         """Get all topics regardless of enabled status."""
         if self._all_topics_cache is not None:
             return self._all_topics_cache
 
-        all_topics = {}
-        units = self.config.get("units", {})
-        
-        for unit_key, unit_data in units.items():
-            topics = unit_data.get("topics", {})
-            for topic_key, topic_data in topics.items():
-                topic_with_unit = topic_data.copy()
-                topic_with_unit["unit"] = unit_data.get("unit_name", unit_key)
-                topic_with_unit["unit_key"] = unit_key
-                all_topics[topic_key] = topic_with_unit
+        all_topics = {
+            topic_key: TopicView(topic_data, unit_name, unit_key)
+            for unit_key, unit_name, _, topic_key, topic_data in self._index
+        }
         
         self._all_topics_cache = all_topics
         return all_topics
@@ -107,39 +177,38 @@ class TopicManager:
             return topics[topic_name].get("keywords", [])
         return []
     
-    def get_topic_by_name(self, topic_name: str) -> Optional[dict]:
+    def get_topic_by_name(self, topic_name: str) -> Optional[TopicView]:
         """Get full topic data by name."""
         topics = self.get_all_topics()
         return topics.get(topic_name)
     
     def enable_topic(self, topic_name: str) -> bool:
         """Enable a topic in the configuration."""
-        units = self.config.get("units", {})
-        for unit_data in units.values():
-            topics = unit_data.get("topics", {})
-            if topic_name in topics:
-                topics[topic_name]["enabled"] = True
+        for _, _, _, topic_key, topic_data in self._index:
+            if topic_key == topic_name:
+                topic_data["enabled"] = True
                 self._all_topics_cache = None
                 self._enabled_topics_cache = None
+                self.version += 1
                 return True
         return False
     
     def disable_topic(self, topic_name: str) -> bool:
         """Disable a topic in the configuration."""
-        units = self.config.get("units", {})
-        for unit_data in units.values():
-            topics = unit_data.get("topics", {})
-            if topic_name in topics:
-                topics[topic_name]["enabled"] = False
+        for _, _, _, topic_key, topic_data in self._index:
+            if topic_key == topic_name:
+                topic_data["enabled"] = False
                 self._all_topics_cache = None
                 self._enabled_topics_cache = None
+                self.version += 1
                 return True
         return False
     
     def save_config(self):
         """Save current configuration back to file."""
-        with open(self.config_path, 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=2, ensure_ascii=False)
+        self.config_path.write_bytes(_dump_profile(self.config))
+        _read_profile.cache_clear()
+        self.version += 1
     
     def get_extraction_settings(self) -> dict:
         """Get extraction settings from config."""
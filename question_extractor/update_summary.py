@@ -1,134 +1,202 @@
 import re
 import os
+import functools
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+try:
+    from question_extractor.file_utils import write_atomic
+except ImportError:
+    from file_utils import write_atomic
+
 # Pre-compiled regex patterns
-SUMMARY_SECTION_PATTERN = re.compile(r'(SUMMARY|CUMULATIVE SUMMARY)\s*(=+|-+)\n')
-TOPIC_PATTERN = re.compile(r'Topic: (.*?)\n')
-QUESTION_START_PATTERN = re.compile(r'^Q[\d\w\(\)]+', re.MULTILINE)
-TOPIC_COUNT_REPLACE_PATTERN = re.compile(r'(Topic: (.*?)\nNumber of Questions: )\d+')
-TOTAL_QUESTIONS_PATTERN = re.compile(r'Total questions: \d+')
-EXTRACTED_AT_PATTERN = re.compile(r'Extracted at: \d{4}-\d{2}-\d{2} \d{2}:\d{2}')
-LAST_UPDATED_PATTERN = re.compile(r'Last Updated: .*')
-SUMMARY_SEPARATOR_PATTERN = re.compile(r'(SUMMARY|CUMULATIVE SUMMARY)\s*\n(=+|-+)\n')
-
-def update_file_summary(file_path):
-    if not os.path.exists(file_path):
-        print(f"Error: {file_path} not found.")
+# The separator usually sits on its own line, but "SUMMARY =====" is accepted too
+SUMMARY_HEADER_PATTERN = re.compile(r'(?P<summary>CUMULATIVE SUMMARY|SUMMARY)(?P<gap>\s*)(?P<sep>=+|-+)\n')
+# One alternation covering every construct the summary update reads or rewrites,
+# so the file is scanned in a single pass
+SUMMARY_TOKEN_PATTERN = re.compile(
+    r'Topic: (?P<topic>[^\n]*)\n(?:Number of Questions: (?P<count>\d+))?'
+    r'|Total questions: (?P<total>\d+)'
+    r'|Extracted at: (?P<extracted>\d{4}-\d{2}-\d{2} \d{2}:\d{2})'
+    r'|Last Updated: (?P<updated>.*)'
+)
+
+# Files may be updated from several threads; keep each file's report together
+_print_lock = threading.Lock()
+
+def _report(*lines):
+    """Print a file's report lines as one block."""
+    with _print_lock:
+        print("\n".join(lines))
+
+def _count_question_markers(content, start, end):
+    """
+    Count lines in content[start:end] that start with a Q marker (Q1, Q2(ii), ...).
+    "\nQ" is rare, so str.find jumps between candidates and only those are checked.
+    """
+    count = 0
+    pos = content.find('\nQ', start, end)
+    while pos != -1:
+        after = pos + 2
+        if after < end and (content[after].isalnum() or content[after] in '_()'):
+            count += 1
+        pos = content.find('\nQ', after, end)
+    return count
+
+def _find_last_summary(content):
+    """
+    Find the last SUMMARY / CUMULATIVE SUMMARY header (with its separator line).
+    Summaries sit near EOF, so search backwards instead of scanning the whole file.
+    """
+    end = len(content)
+    while True:
+        pos = content.rfind('SUMMARY', 0, end)
+        if pos == -1:
+            return None
+        start = pos
+        if pos >= 11 and content.startswith('CUMULATIVE ', pos - 11):
+            start = pos - 11
+        match = SUMMARY_HEADER_PATTERN.match(content, start)
+        if match:
+            return match
+        end = pos + len('SUMMARY') - 1
+
+def _emit(content, edits):
+    """
+    Yield the output chunks in file order: untouched slices of content with the
+    (start, end, value) edits spliced in, so the whole rewrite is one join.
+    """
+    pos = 0
+    for start, end, value in edits:
+        yield content[pos:start]
+        yield value
+        pos = end
+    yield content[pos:]
+
+def update_file_summary(file_path, now_str=None):
+    """
+    Recount the questions under each topic header and rewrite the last summary
+    section, the per-topic header counts, totals and timestamps.
+    now_str ("YYYY-MM-DD HH:MM") lets a batch stamp every file identically;
+    it defaults to the current time.
+    """
+    # One block read and a single decode instead of a buffered text-mode reader
+    try:
+        content = Path(file_path).read_bytes().decode('utf-8')
+    except FileNotFoundError:
+        _report(f"Error: {file_path} not found.")
         return
+    if '\r' in content:
+        # Match text-mode universal newlines
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    summary_start = content.find('SUMMARY')
-    if summary_start == -1:
-        # Check if there is a "BATCH \d SUMMARY" or "CUMULATIVE SUMMARY"
-        summary_start = content.find('CUMULATIVE SUMMARY')
-        if summary_start == -1:
-            print(f"Error: Could not find SUMMARY section in {file_path}.")
-            return
-
-    # Extract sections and count questions
-    counts = {}
-    
-    # Simple counting strategy: Find all Q[Number] at start of lines in the whole file
-    # This might double count if there are multiple batches, so we'll be more precise
-    # if the file has Batch summaries.
-    
     # Find the very last summary section to update
-    summary_matches = list(SUMMARY_SECTION_PATTERN.finditer(content))
-    if not summary_matches:
-         print(f"Error: Could not find SUMMARY section in {file_path}.")
-         return
-    
-    last_summary_match = summary_matches[-1]
-    last_summary_pos = last_summary_match.start()
-
-    # For simplicity and robustness across different file structures:
-    # We will look for all Q[Num] markers that appear BEFORE the last summary
-    main_content = content[:last_summary_pos]
-    
-    # Split by topic to get individual counts
-    topic_positions = []
-    for m in TOPIC_PATTERN.finditer(main_content):
-        topic_positions.append((m.start(), m.group(1)))
-
-    if not topic_positions:
-        print(f"Warning: No topic headers found in {file_path}. Topic headers should match 'Topic: [Name]'")
+    last_summary = _find_last_summary(content)
+    if last_summary is None:
+        _report(f"Error: Could not find SUMMARY section in {file_path}.")
         return
-    
-    topic_positions.sort()
-    
-    for i in range(len(topic_positions)):
-        start_pos = topic_positions[i][0]
-        end_pos = topic_positions[i+1][0] if i+1 < len(topic_positions) else last_summary_pos
-        topic_name = topic_positions[i][1]
-        
-        section_text = main_content[start_pos:end_pos]
-        # Count unique Q markers (to handle cases where a question is repeated in different batches if that happens)
-        # In these files, Q numbers are unique per batch.
-        q_matches = QUESTION_START_PATTERN.findall(section_text)
-        counts[topic_name] = counts.get(topic_name, 0) + len(q_matches)
+    last_summary_pos = last_summary.start()
 
-    total = sum(counts.values())
-
-    # Update individual section headers if they have "Number of Questions: \d+"
-    def replace_count(match):
-        prefix = match.group(1)
-        topic_name = match.group(2)
-        if topic_name in counts:
-            return f"{prefix}{counts[topic_name]}"
-        return match.group(0)
-
-    content = TOPIC_COUNT_REPLACE_PATTERN.sub(replace_count, content)
+    # Count the Q[Num] markers under each topic header that appears BEFORE the last summary.
+    # In these files, Q numbers are unique per batch.
+    tokens_before = list(SUMMARY_TOKEN_PATTERN.finditer(content, 0, last_summary_pos))
+    topic_tokens = [token for token in tokens_before if token.group('topic') is not None]
+    counts = {}
+    for i, token in enumerate(topic_tokens):
+        section_end = topic_tokens[i + 1].start() if i + 1 < len(topic_tokens) else last_summary_pos
+        topic_name = token.group('topic')
+        counts[topic_name] = counts.get(topic_name, 0) + _count_question_markers(content, token.start(), section_end)
 
-    # Update Global Headers
-    content = TOTAL_QUESTIONS_PATTERN.sub(f'Total questions: {total}', content)
-    
-    now_str = datetime.now().strftime("%Y-%m-%d %H:%M")
-    content = EXTRACTED_AT_PATTERN.sub(f'Extracted at: {now_str}', content)
-    content = LAST_UPDATED_PATTERN.sub(f'Last Updated: {now_str}', content)
-
-    # Update the last summary section
-    summary_replacement = ""
-    for topic in sorted(counts.keys()):
-        summary_replacement += f"  {topic}: {counts[topic]} questions\n"
-    summary_replacement += f"  Total questions: {total}"
-
-    # Re-find the last summary section as offsets might have changed
-    summary_matches = list(SUMMARY_SECTION_PATTERN.finditer(content))
-    if summary_matches:
-        last_summary_pos = summary_matches[-1].start()
-    
-    # Detect the separator used in the summary (= or -)
-    sep_match = SUMMARY_SEPARATOR_PATTERN.search(content[last_summary_pos:])
-    if sep_match:
-        sep = sep_match.group(2)
-        header_type = sep_match.group(1)
-        new_summary_section = f"{header_type}\n{sep}\n{summary_replacement}\n{sep}"
-        # Replace the section between two separators
-        # Note: re.escape is needed for the separator in the pattern
-        # We construct a specific pattern for this replacement since it depends on captured separator
-        # This one is tricky to pre-compile generically as 'sep' changes, but likely it's always = or -
-        # Use a dynamic pattern here is fine as it's once per file
-        content = re.sub(rf'{header_type}\s*\n{re.escape(sep)}\n.*?\n{re.escape(sep)}', 
-                        new_summary_section, content, flags=re.DOTALL)
-
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-
-    print(f"Summary Updated Successfully for {os.path.basename(file_path)}!")
-    print(f"Total Questions: {total}")
-    for k, v in sorted(counts.items()):
-        print(f"  - {k}: {v}")
+    if not counts:
+        _report(f"Warning: No topic headers found in {file_path}. Topic headers should match 'Topic: [Name]'")
+        return
 
-if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        for arg in sys.argv[1:]:
-            update_file_summary(arg)
+    total = sum(counts.values())
+    if now_str is None:
+        now_str = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+    # Rebuild the last summary section
+    summary_lines = [f"  {topic}: {counts[topic]} questions\n" for topic in sorted(counts)]
+    summary_lines.append(f"  Total questions: {total}")
+    sep = last_summary.group('sep')
+    if last_summary.group('gap').endswith('\n'):
+        summary_end = content.find(f"\n{sep}", last_summary.end())
     else:
+        # Separator on the header line: only the counts and totals are updated
+        summary_end = -1
+    new_summary_section = f"{last_summary.group('summary')}\n{sep}\n{''.join(summary_lines)}\n{sep}"
+    summary_region_end = last_summary_pos if summary_end == -1 else summary_end + 1 + len(sep)
+
+    # Headers, totals and timestamps after the summary are rewritten too
+    tokens = tokens_before + [last_summary]
+    tokens.extend(SUMMARY_TOKEN_PATTERN.finditer(content, summary_region_end))
+
+    # Collect the (start, end, replacement) edits in file order
+    edits = []
+    for token in tokens:
+        if token is last_summary:
+            if summary_end != -1:
+                edits.append((token.start(), summary_region_end, new_summary_section))
+            continue
+
+        # lastgroup names the alternative that matched ("count" only when a
+        # topic header carries "Number of Questions: \d+")
+        kind = token.lastgroup
+        if kind == 'count':
+            topic = token.group('topic')
+            if topic not in counts:
+                continue
+            value = str(counts[topic])
+        elif kind == 'topic':
+            continue
+        elif kind == 'total':
+            value = str(total)
+        else:
+            value = now_str
+
+        start, end = token.span(kind)
+        edits.append((start, end, value))
+
+    # Re-runs on an up-to-date file leave it (and its mtime) untouched
+    changed = any(
+        end - start != len(value) or not content.startswith(value, start)
+        for start, end, value in edits
+    )
+
+    if changed:
+        write_atomic(file_path, "".join(_emit(content, edits)))
+        status = f"Summary Updated Successfully for {os.path.basename(file_path)}!"
+    else:
+        status = f"No changes needed for {os.path.basename(file_path)}; summary is already up to date."
+    _report(
+        status,
+        f"Total Questions: {total}",
+        *(f"  - {k}: {v}" for k, v in sorted(counts.items())),
+    )
+
+def main(argv=None):
+    """
+    Update the summaries of the given files (defaults to sys.argv[1:]).
+    With no paths, the original Commercial_Math_Questions.txt is updated.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
         # Default to the existing file if no args
         update_file_summary('Commercial_Math_Questions.txt')
+        return 0
+
+    # Files are independent, so update them concurrently; duplicates would
+    # race on the same temp-file swap, so each path is handled once
+    paths = list(dict.fromkeys(argv))
+    # Format the timestamp once so every file in the batch gets the same one
+    now_str = datetime.now().strftime("%Y-%m-%d %H:%M")
+    with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as executor:
+        list(executor.map(functools.partial(update_file_summary, now_str=now_str), paths))
+    return 0
 
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the project root importable once for every test module here
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
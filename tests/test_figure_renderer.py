@@ -1,41 +1,14 @@
+import io
 import sys
-import os
 from pathlib import Path
-
-# Add the parent directory to the path so we can import the modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from typing import Optional
 
 from question_extractor.geometry_schema import FigureParser
-from question_extractor.figure_renderer import FigureRenderer
-
-try:
-    import matplotlib.pyplot as plt
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+from question_extractor.figure_renderer import FigureRenderer, RenderConfig, MATPLOTLIB_AVAILABLE
 
-def test(output_dir: str = "./test_figures"):
-    """Test figure rendering with sample figures."""
-    
-    if not MATPLOTLIB_AVAILABLE:
-        print("Cannot run tests: matplotlib not installed")
-        return
-    
-    # Create output directory
-    output_path = Path(output_dir)
-    output_path.mkdir(exist_ok=True)
-    
-    print("=" * 60)
-    print("Testing Figure Renderer")
-    print("=" * 60)
-    
-    parser = FigureParser()
-    renderer = FigureRenderer()
-    
-    # Test 1: Circle with inscribed triangle
-    print("\n1. Rendering: Circle with inscribed triangle")
-    
-    figure_yaml = """
+# Sample figures: (heading, output file stem, YAML block)
+_FIGURE_CASES = [
+    ("Circle with inscribed triangle", "test_inscribed_triangle", """
 type: circle_inscribed_angle
 description: Circle with center O and inscribed triangle ABC
 elements:
@@ -51,18 +24,8 @@ elements:
       rays: [B, C]
       value: "50°"
       marked: true
-"""
-    
-    figure = parser.parse(figure_yaml)
-    renderer.render(figure)
-    renderer.save_png(str(output_path / "test_inscribed_triangle.png"))
-    renderer.close()
-    print(f"   Saved: {output_path / 'test_inscribed_triangle.png'}")
-    
-    # Test 2: Tangent from external point
-    print("\n2. Rendering: Tangent from external point")
-    
-    figure_yaml = """
+"""),
+    ("Tangent from external point", "test_tangent", """
 type: circle_tangent
 description: Circle with tangent PT from external point P
 elements:
@@ -77,18 +40,8 @@ elements:
   - line:
       points: [O, T]
       style: dashed
-"""
-    
-    figure = parser.parse(figure_yaml)
-    renderer.render(figure)
-    renderer.save_png(str(output_path / "test_tangent.png"))
-    renderer.close()
-    print(f"   Saved: {output_path / 'test_tangent.png'}")
-    
-    # Test 3: Cyclic quadrilateral
-    print("\n3. Rendering: Cyclic quadrilateral")
-    
-    figure_yaml = """
+"""),
+    ("Cyclic quadrilateral", "test_cyclic_quad", """
 type: cyclic_quadrilateral
 description: Cyclic quadrilateral ABCD inscribed in circle
 elements:
@@ -110,18 +63,8 @@ elements:
       rays: [B, D]
       value: "100°"
       marked: true
-"""
-    
-    figure = parser.parse(figure_yaml)
-    renderer.render(figure)
-    renderer.save_png(str(output_path / "test_cyclic_quad.png"))
-    renderer.close()
-    print(f"   Saved: {output_path / 'test_cyclic_quad.png'}")
-    
-    # Test 4: Similar triangles (BPT)
-    print("\n4. Rendering: Similar triangles (BPT)")
-    
-    figure_yaml = """
+"""),
+    ("Similar triangles (BPT)", "test_bpt", """
 type: bpt_triangle
 description: Triangle ABC with DE parallel to BC
 elements:
@@ -138,22 +81,63 @@ elements:
   - line:
       points: [D, E]
       style: solid
-"""
+"""),
+]
+
+# Parse the samples once at import; rendering only needs the parsed figures
+_FIGURES = (
+    [(heading, stem, FigureParser().parse(block)) for heading, stem, block in _FIGURE_CASES]
+    if MATPLOTLIB_AVAILABLE else []
+)
+
+def test(output_dir: Optional[str] = None):
+    """
+    Test figure rendering with sample figures.
     
-    figure = parser.parse(figure_yaml)
-    renderer.render(figure)
-    renderer.save_png(str(output_path / "test_bpt.png"))
-    renderer.close()
-    print(f"   Saved: {output_path / 'test_bpt.png'}")
+    PNGs are rendered in memory unless output_dir is given, in which case
+    they are written there for inspection.
+    """
     
-    print("\n" + "=" * 60)
-    print(f"All test figures saved to: {output_path.absolute()}")
+    if not MATPLOTLIB_AVAILABLE:
+        print("Cannot run tests: matplotlib not installed")
+        return
+    
+    output_path = None
+    if output_dir is not None:
+        # Create output directory
+        output_path = Path(output_dir)
+        output_path.mkdir(exist_ok=True)
+    
+    print("=" * 60)
+    print("Testing Figure Renderer")
     print("=" * 60)
+    
+    # Preview-quality output: low DPI and fast zlib keep the PNG encode cheap
+    renderer = FigureRenderer(RenderConfig(dpi=72, png_compress_level=1))
+    
+    # One renderer and matplotlib figure serve every sample
+    try:
+        for i, (heading, stem, figure) in enumerate(_FIGURES, 1):
+            print(f"\n{i}. Rendering: {heading}")
+            
+            renderer.render(figure)
+            if output_path is None:
+                buffer = io.BytesIO()
+                renderer.save_png(buffer)
+                assert buffer.getbuffer().nbytes > 0, f"Empty PNG for {stem}"
+            else:
+                renderer.save_png(str(output_path / f"{stem}.png"))
+                print(f"   Saved: {output_path / f'{stem}.png'}")
+            renderer.clear()
+    finally:
+        renderer.close()
+    
+    if output_path is not None:
+        print("\n" + "=" * 60)
+        print(f"All test figures saved to: {output_path.absolute()}")
+        print("=" * 60)
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        output_dir = sys.argv[1]
-        test(output_dir)
-    else:
-        test()
+    # Run as a script, the figures are written out for inspection
+    test(sys.argv[1] if len(sys.argv) > 1 else "./test_figures")
@@ -1,12 +1,7 @@
 
 import unittest
-import sys
-import os
 from typing import List
 
-# Add the parent directory to the path so we can import the modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from question_extractor.paper_generator import QuestionBankParser, PaperBuilder, Question, Section
 
 class TestQuestionBankParser(unittest.TestCase):